@@ -2,8 +2,9 @@
 import preferences
 import arcpy
 import os
-import re
-from datetime import datetime
+
+# Deletes the characters Windows rejects in file/folder names (C-level str.translate)
+INVALID_FILENAME_CHARS = str.maketrans("", "", '\\/:*?"<>|')
 
 def do_all_the_things(prefix: str, 
                       include_prefix: bool, 
@@ -38,17 +39,18 @@ def make_new_project(prefix: str,
     new_aprx = create_aprx(project_folder)
     _ = set_connections(new_aprx, project_folder, project_name)
     _ = rename_map(base_project_name, new_aprx)
-    _ = make_connections(other_folders)
+    other_folders = [os.path.join(project_folder, folder)
+                     for folder in preferences.folders_to_connect]
+    _ = make_connections(new_aprx, project_folder, other_folders)
 
 
 
 # Sanitize and create full project name
 def make_project_name(prefix, include_prefix, project_name):
-    invalid_filename_chars = r'[\\/:*?"<>|]'     
-    valid_base_name = re.sub(invalid_filename_chars, "", project_name.strip())
+    valid_base_name = project_name.strip().translate(INVALID_FILENAME_CHARS)
 
     if include_prefix:
-        valid_prefix = re.sub(invalid_filename_chars, "", prefix.strip())
+        valid_prefix = prefix.strip().translate(INVALID_FILENAME_CHARS)
         full_project_name = f"{valid_prefix}_{valid_base_name}"
     else:
         full_project_name = valid_base_name
@@ -56,10 +58,10 @@ def make_project_name(prefix, include_prefix, project_name):
 
 def create_project_folders(project_name: str) -> list:
     project_folder = os.path.join(preferences.projects_folder, project_name)
-    if os.path.exists(project_folder):
-        raise FileExistsError(f"❌ Project folder already exists: {project_folder}")
-    else:
+    try:
         os.makedirs(project_folder)
+    except FileExistsError:
+        raise FileExistsError(f"❌ Project folder already exists: {project_folder}") from None
     
     folder_list = [project_folder]
     for folder in preferences.folders_to_make:
@@ -89,30 +91,43 @@ def rename_map(base_project_name, new_aprx):
         if map.name == "_BaseTemplateMap":
             map.name = base_project_name
 
-def make_connections(other_folders):
-    pass
+def make_connections(new_aprx, project_folder, other_folders):
+    folder_connections = _build_folder_connections(project_folder, other_folders)
+    new_aprx.updateFolderConnections(folder_connections)
 
 
 # 5) Build folder connections from scratch
 def _normalized(path: str) -> str:
     """Return a normalized absolute path for equality checks (case-insensitive on Windows)."""
+    # Absolute paths don't need abspath's getcwd() call
+    if os.path.isabs(path):
+        return os.path.normcase(os.path.normpath(path))
     return os.path.normcase(os.path.abspath(path))
 
-normalized_home = _normalized(project_folder)
-folder_connections = [{
-    "connectionString": project_folder,
-    "alias": "",
-    "isHomeFolder": True
-}]
-
-for candidate_path in additional_folder_connections:
-    if not candidate_path:
-        continue
-    if _normalized(candidate_path) == normalized_home:
-        # Skip adding a duplicate of the home folder as a separate connection
-        continue
-    folder_connections.append({
-        "connectionString": candidate_path,
+def _build_folder_connections(project_folder, additional_folder_connections):
+    """Return the home folder connection plus each unique additional folder."""
+    normalized_home = _normalized(project_folder)
+    folder_connections = [{
+        "connectionString": project_folder,
         "alias": "",
-        "isHomeFolder": False
-    })
\ No newline at end of file
+        "isHomeFolder": True
+    }]
+
+    # Normalized paths already connected; skips the home folder and any repeats
+    seen_connections = {normalized_home}
+
+    for candidate_path in additional_folder_connections:
+        if not candidate_path:
+            continue
+        normalized_candidate = _normalized(candidate_path)
+        if normalized_candidate in seen_connections:
+            # Skip adding a duplicate of the home folder (or an earlier entry)
+            continue
+        seen_connections.add(normalized_candidate)
+        folder_connections.append({
+            "connectionString": candidate_path,
+            "alias": "",
+            "isHomeFolder": False
+        })
+
+    return folder_connections
@@ -2,94 +2,380 @@
 ExportToExcel.py 
 ----------------
 Export attribute tables from *visible* feature layers in the active map
-to a single Excel workbook. Each layer is preceded by a one-row label
-containing the dataset (feature class) name.
+to a single Excel workbook, one worksheet per layer.
 
 Behavior:
 - Iterates only layers that are effectively visible (respects group visibility).
-- Writes each layer's full table to a single sheet (default sheet 'Sheet1'),
-  stacked vertically: [label row] + [table], repeated for each layer.
+- Each table starts with a one-row label containing the dataset (feature
+  class) name, followed by the field names, followed by the table rows.
+- Optionally stacks every table on a single sheet ('Sheet1') instead:
+  [label row] + [field names] + [rows], repeated for each layer.
+- Streams rows from arcpy.da.SearchCursor straight into an xlsxwriter
+  worksheet in constant_memory mode (no pandas DataFrame in between), so
+  memory stays flat regardless of table size.
+- Optionally writes one workbook per layer instead, reading several layers
+  at once on a small thread pool.
 
 Dependencies:
-- pandas (with openpyxl engine)
+- xlsxwriter
 - arcpy
-- arctools.get_all_feature_layers for visibility-aware traversal
+- arctools.get_all_feature_layers_with_paths for visibility-aware traversal
 """
 
 import arcpy
 import os
-import pandas as pd
-import re as re
+import xlsxwriter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 import arctools as tools
 
+# Deletes the characters Excel rejects in worksheet names (C-level str.translate)
+INVALID_SHEET_NAME_CHARS = str.maketrans("", "", "[]:*?/\\")
 
-def export_tables_to_excel(output_excel_path: str) -> None:
+# Excel's worksheet-name length limit
+MAX_SHEET_NAME_LENGTH = 31
+
+# Excel's row limit; xlsxwriter ignores (returns -1 for) writes past it
+MAX_WORKSHEET_ROWS = 1_048_576
+
+# Field types that can't be written to a cell (and are expensive to read)
+SKIPPED_FIELD_TYPES = ("Geometry", "Blob", "Raster")
+
+# Field types TableToNumPyArray reads natively (fixed-width numeric dtypes)
+NUMERIC_FIELD_TYPES = ("OID", "SmallInteger", "Integer", "Single", "Double")
+
+# Field types whose cursor values xlsxwriter writes as-is (str, int, float,
+# datetime/date/time, None). Anything else (e.g. BigInteger beyond Excel's
+# 15-digit precision, timezone-aware TimestampOffset) is written as text.
+NATIVE_FIELD_TYPES = ("OID", "SmallInteger", "Integer", "Single", "Double",
+                      "String", "Guid", "GlobalID", "Date", "DateOnly", "TimeOnly")
+
+# Shared xlsxwriter options: stream rows to disk, write text verbatim,
+# and show dates as dates rather than bare serial numbers
+WORKBOOK_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+# Per-type number formats for values the workbook-wide date format would mangle:
+# DateOnly would gain a fake 00:00:00, TimeOnly a nonsense 1900-01-00 date
+FIELD_TYPE_NUM_FORMATS = {
+    "DateOnly": "yyyy-mm-dd",
+    "TimeOnly": "hh:mm:ss",
+}
+
+# More concurrent readers than this mostly just fight over file-gdb locks
+MAX_EXPORT_WORKERS = 4
+
+
+def make_sheet_name(layer_name: str, used_sheet_names: set) -> str:
     """
-    Export visible feature-layer attribute tables in the active map to an Excel file.
+    Return an Excel-safe, unique worksheet name for `layer_name`.
+
+    Invalid characters are removed and the name is cut to 31 characters.
+    Excel treats sheet names case-insensitively and refuses duplicates, so
+    repeats get a " (2)", " (3)", ... suffix. `used_sheet_names` holds the
+    lower-cased names taken so far and is updated in place.
+    """
+    base_name = layer_name.translate(INVALID_SHEET_NAME_CHARS)[:MAX_SHEET_NAME_LENGTH] or "Sheet"
+    sheet_name = base_name
+    copy_number = 1
+    while sheet_name.lower() in used_sheet_names:
+        copy_number += 1
+        suffix = f" ({copy_number})"
+        sheet_name = base_name[:MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+    used_sheet_names.add(sheet_name.lower())
+    return sheet_name
+
+
+def make_file_stem(layer_name: str, used_file_stems: set) -> str:
+    """
+    Return a Windows-safe, unique file-name part for `layer_name`.
+
+    Removes the characters Windows rejects in file names and the trailing
+    dots/spaces it silently drops. Windows file names are case-insensitive,
+    so repeats get a " (2)", " (3)", ... suffix. `used_file_stems` holds the
+    lower-cased stems taken so far and is updated in place.
+    """
+    base_stem = layer_name.translate(tools.INVALID_FILENAME_CHARS).rstrip(". ") or "Layer"
+    file_stem = base_stem
+    copy_number = 1
+    while file_stem.lower() in used_file_stems:
+        copy_number += 1
+        file_stem = f"{base_stem} ({copy_number})"
+    used_file_stems.add(file_stem.lower())
+    return file_stem
+
+
+def add_field_type_formats(workbook) -> dict:
+    """Register FIELD_TYPE_NUM_FORMATS on `workbook`; returns {field type: Format}."""
+    return {field_type: workbook.add_format({"num_format": num_format})
+            for field_type, num_format in FIELD_TYPE_NUM_FORMATS.items()}
+
+
+@lru_cache(maxsize=None)
+def get_exportable_fields(dataset_path: str) -> tuple:
+    """
+    Return the Field objects of `dataset_path` that can be written to cells.
+
+    Uses arcpy.da.Describe (lighter than arcpy.ListFields) and is memoized per
+    path, so a dataset shown by several layers is only described once per run.
+    `export_tables_to_excel` clears the cache at the start of every export.
+    """
+    return tuple(f for f in arcpy.da.Describe(dataset_path)["fields"]
+                 if f.type not in SKIPPED_FIELD_TYPES)
+
+
+def write_dataset_to_worksheet(worksheet,
+                               dataset_path: str,
+                               first_row: int = 0,
+                               field_type_formats: dict | None = None) -> int:
+    """
+    Stream one dataset's attribute table into an xlsxwriter worksheet.
+
+    Layout, starting at `first_row`: dataset name, field names, then records.
+    Rows are written strictly top to bottom, as constant_memory requires.
+    Returns the index of the first row after the table.
+
+    `field_type_formats` (from `add_field_type_formats`) gives DateOnly and
+    TimeOnly columns their own number format; without it they fall back to
+    the workbook's date-and-time default.
+
+    Tables made only of non-nullable numeric fields are read in one shot with
+    arcpy.da.TableToNumPyArray (C-side, native dtypes); everything else,
+    or anything the NumPy reader rejects, goes through a SearchCursor.
+
+    Raises ValueError if the table doesn't fit below `first_row` within Excel's
+    row limit; the rows that fit stay on the sheet.
+    """
+    dataset_name = os.path.basename(dataset_path)
+    fields = get_exportable_fields(dataset_path)
+    field_names = [f.name for f in fields]
+
+    if first_row + 2 > MAX_WORKSHEET_ROWS:
+        raise ValueError(f"No room left on the sheet for {dataset_name} "
+                         f"(Excel's limit is {MAX_WORKSHEET_ROWS:,} rows).")
+
+    worksheet.write(first_row, 0, dataset_name)
+    worksheet.write_row(first_row + 1, 0, field_names)
+    next_row = first_row + 2
+    row_capacity = MAX_WORKSHEET_ROWS - next_row
+
+    # Nullable fields are excluded: the NumPy reader would need a sentinel
+    # (e.g. -9999) for nulls, which would then end up in the spreadsheet.
+    if all(f.type in NUMERIC_FIELD_TYPES and not f.isNullable for f in fields):
+        try:
+            records = arcpy.da.TableToNumPyArray(dataset_path, field_names, skip_nulls=False)
+        except (TypeError, RuntimeError):
+            records = None
+        if records is not None:
+            for row_index, record in enumerate(records[:row_capacity], start=next_row):
+                worksheet.write_row(row_index, 0, record.tolist())
+            if len(records) > row_capacity:
+                raise _rows_dropped_error(dataset_name, row_capacity)
+            return next_row + len(records)
+
+    # Usual case: every value is cell-ready, so cursor tuples go straight in
+    text_column_indexes = [index for index, f in enumerate(fields)
+                           if f.type not in NATIVE_FIELD_TYPES]
+    field_type_formats = field_type_formats or {}
+    formatted_columns = [(index, field_type_formats[f.type]) for index, f in enumerate(fields)
+                         if f.type in field_type_formats]
+
+    with arcpy.da.SearchCursor(dataset_path, field_names) as cursor:
+        # islice keeps the row loops free of a per-row limit check
+        rows = islice(cursor, row_capacity)
+        if not text_column_indexes and not formatted_columns:
+            for row in rows:
+                worksheet.write_row(next_row, 0, row)
+                next_row += 1
+        else:
+            for row in rows:
+                if text_column_indexes:
+                    row = list(row)
+                    for index in text_column_indexes:
+                        if row[index] is not None:
+                            row[index] = str(row[index])
+                worksheet.write_row(next_row, 0, row)
+                # Same row again: constant_memory only flushes once the next row starts
+                for index, cell_format in formatted_columns:
+                    if row[index] is not None:
+                        worksheet.write_datetime(next_row, index, row[index], cell_format)
+                next_row += 1
+        if next(cursor, None) is not None:
+            raise _rows_dropped_error(dataset_name, row_capacity)
+    return next_row
+
+
+def _rows_dropped_error(dataset_name: str, rows_written: int) -> ValueError:
+    """Error for a table cut off at Excel's row limit (pandas used to refuse these outright)."""
+    return ValueError(f"{dataset_name} was cut off after {rows_written:,} rows: "
+                      f"Excel sheets hold at most {MAX_WORKSHEET_ROWS:,} rows.")
+
+
+def _export_dataset_to_own_workbook(output_excel_path: str,
+                                    sheet_name: str,
+                                    dataset_path: str) -> str:
+    """Worker for the one-file-per-layer mode; touches only paths, never map objects."""
+    workbook = xlsxwriter.Workbook(output_excel_path, WORKBOOK_OPTIONS)
+    try:
+        write_dataset_to_worksheet(workbook.add_worksheet(sheet_name),
+                                   dataset_path,
+                                   field_type_formats=add_field_type_formats(workbook))
+    finally:
+        workbook.close()
+    return output_excel_path
+
+
+def export_tables_to_excel(output_excel_path: str,
+                           one_file_per_layer: bool = False,
+                           stack_on_single_sheet: bool = False) -> None:
+    """
+    Export visible feature-layer attribute tables in the active map to Excel.
 
     Parameters
     ----------
     output_excel_path : str
         Full path to the Excel workbook to create (e.g., r"C:\...\KMZ Excel.xlsx").
+    one_file_per_layer : bool, optional
+        If True, write each layer to its own workbook next to `output_excel_path`
+        (named "<stem>_<layer>.xlsx"), exporting up to MAX_EXPORT_WORKERS layers
+        concurrently. By default, all layers go into a single workbook.
+    stack_on_single_sheet : bool, optional
+        If True (and `one_file_per_layer` is False), stack every layer on one
+        sheet named 'Sheet1' instead of giving each layer its own sheet.
 
     Notes
     -----
-    - Overwrites if the file already exists.
-    - Uses a single worksheet; layers are stacked with a dataset-name header row.
-    - For very large tables, this will be memory- and time-intensive (pandas).
+    - Overwrites if the file(s) already exist.
+    - Each table is written as [dataset name] + [field names] + [rows].
+    - Uses xlsxwriter constant_memory mode: each row is flushed to disk once
+      the next row starts, so rows must be written strictly top to bottom.
+    - Geometry, BLOB, and raster fields are skipped; the cursor never builds
+      geometry objects for the shape column.
+    - Formula/URL detection is disabled so text cells are written verbatim
+      (and without a per-cell regex scan).
     """
-    current_project = arcpy.mp.ArcGISProject("CURRENT")
-    active_map = current_project.activeMap
+    # Schemas may have changed since the last run in this Pro session
+    get_exportable_fields.cache_clear()
+
+    active_map = tools.get_active_map()
 
     # Collect only effectively visible feature layers (respects group visibility)
-    feature_layers = tools.get_all_feature_layers(
+    # (dataSource is read once here and passed around as a plain path)
+    feature_layers = tools.get_all_feature_layers_with_paths(
         active_map.listLayers(),
-        visible_only=True,
-        include_groups=False
+        visible_only=True
     )
 
-    # Create an Excel writer
-    writer = pd.ExcelWriter(output_excel_path, engine="openpyxl")
-    next_row_index = 0
+    if one_file_per_layer:
+        _export_tables_to_separate_workbooks(output_excel_path, feature_layers)
+        return
 
-    # Create an Excel writer
-    writer = pd.ExcelWriter(output_excel_path, engine="openpyxl")
+    # Streaming workbook: rows are flushed as soon as the next row begins
+    workbook = xlsxwriter.Workbook(output_excel_path, WORKBOOK_OPTIONS)
+    try:
+        if stack_on_single_sheet:
+            _write_stacked_sheet(workbook, feature_layers)
+        else:
+            _write_sheet_per_layer(workbook, feature_layers)
+    finally:
+        # Always close, even on an unexpected error: constant_memory keeps a
+        # temp file open per worksheet until the workbook is closed.
+        workbook.close()
 
-    for feature_layer in feature_layers:
-        try:
-            dataset_path = feature_layer.dataSource
-            dataset_name = os.path.basename(dataset_path)
+    layout_description = "stacked on one sheet" if stack_on_single_sheet else "one sheet per layer"
+    arcpy.AddMessage(f"✅ Exported to Excel ({layout_description}): {output_excel_path}")
 
-            # Build fields & dataframe
-            field_names = [f.name for f in arcpy.ListFields(dataset_path)]
-            with arcpy.da.SearchCursor(dataset_path, field_names) as cursor:
-                rows = [list(row) for row in cursor]
-            df = pd.DataFrame(rows, columns=field_names)
 
-            # If the dataframe is empty, add a dummy blank row
-            if df.empty:
-                df = pd.DataFrame([{field_names[0]: ""}], columns=field_names)
+def _write_sheet_per_layer(workbook, feature_layers) -> None:
+    """
+    Write each (layer, dataset_path) pair to its own worksheet, named after the layer.
+    """
+    used_sheet_names = set()
+    field_type_formats = add_field_type_formats(workbook)
+
+    for feature_layer, dataset_path in feature_layers:
+        try:
+            # Use layer name as sheet/tab name (Excel-safe, unique)
+            sheet_name = make_sheet_name(feature_layer.name, used_sheet_names)
+            worksheet = workbook.add_worksheet(sheet_name)
+            write_dataset_to_worksheet(worksheet, dataset_path,
+                                       field_type_formats=field_type_formats)
 
-            # Use layer name as sheet/tab name (Excel-safe)
-            sheet_name = re.sub(r'[\[\]\:\*\?\/\\]', '', feature_layer.name)[:31]
+        except Exception as exc:
+            arcpy.AddWarning(f"⚠️ Failed to export: {feature_layer.name}\n{exc}")
 
-            # Write one sheet per layer
-            df.to_excel(
-                writer,
-                sheet_name=sheet_name,
-                index=False
-            )
 
+def _write_stacked_sheet(workbook, feature_layers) -> None:
+    """
+    Write every (layer, dataset_path) pair, one after another, onto a single
+    'Sheet1' worksheet.
+    """
+    worksheet = workbook.add_worksheet("Sheet1")
+    field_type_formats = add_field_type_formats(workbook)
+    next_row_index = 0
 
+    for feature_layer, dataset_path in feature_layers:
+        try:
+            next_row_index = write_dataset_to_worksheet(worksheet,
+                                                        dataset_path,
+                                                        first_row=next_row_index,
+                                                        field_type_formats=field_type_formats)
         except Exception as exc:
             arcpy.AddWarning(f"⚠️ Failed to export: {feature_layer.name}\n{exc}")
+            # Resume below whatever part of the table made it onto the sheet;
+            # constant_memory silently drops writes to rows already flushed.
+            if worksheet.dim_rowmax is not None:
+                next_row_index = max(next_row_index, worksheet.dim_rowmax + 1)
 
-    writer.close()
-    arcpy.AddMessage(f"✅ Exported to Excel (one sheet per layer): {output_excel_path}")
 
+def _export_tables_to_separate_workbooks(output_excel_path: str, feature_layers) -> None:
+    """
+    Export each layer to "<stem>_<layer>.xlsx" using a small thread pool.
+
+    Layer properties are read here on the calling thread; workers only get
+    plain paths, and all arcpy messaging happens back on the calling thread
+    (as each export finishes). A single layer is exported inline, no pool.
+    """
+    output_stem, output_extension = os.path.splitext(output_excel_path)
+    used_file_stems = set()
+
+    export_jobs = []
+    for feature_layer, dataset_path in feature_layers:
+        # Each workbook holds one sheet, so only the file names must be unique
+        sheet_name = make_sheet_name(feature_layer.name, set())
+        file_stem = make_file_stem(feature_layer.name, used_file_stems)
+        layer_output_path = f"{output_stem}_{file_stem}{output_extension}"
+        export_jobs.append((feature_layer.name, (layer_output_path, sheet_name, dataset_path)))
 
+    if len(export_jobs) <= 1:
+        for layer_name, job_arguments in export_jobs:
+            try:
+                arcpy.AddMessage(f"  ➤ {layer_name} → {_export_dataset_to_own_workbook(*job_arguments)}")
+            except Exception as exc:
+                arcpy.AddWarning(f"⚠️ Failed to export: {layer_name}\n{exc}")
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_EXPORT_WORKERS, len(export_jobs))) as executor:
+            layer_names_by_future = {
+                executor.submit(_export_dataset_to_own_workbook, *job_arguments): layer_name
+                for layer_name, job_arguments in export_jobs
+            }
+            for future in as_completed(layer_names_by_future):
+                layer_name = layer_names_by_future[future]
+                try:
+                    arcpy.AddMessage(f"  ➤ {layer_name} → {future.result()}")
+                except Exception as exc:
+                    arcpy.AddWarning(f"⚠️ Failed to export: {layer_name}\n{exc}")
+
+    arcpy.AddMessage(f"✅ Exported to Excel (one file per layer): {os.path.dirname(output_excel_path)}")
 
 if __name__ == "__main__":
+    tools.reset_project_cache()
+
     # Parameter 0: desired base filename (default "KMZ Excel")
     base_file_name = arcpy.GetParameterAsText(0).strip() or "KMZExcel"
 
@@ -97,7 +383,7 @@ if __name__ == "__main__":
     if not base_file_name.lower().endswith(".xlsx"):
         base_file_name += ".xlsx"
 
-    current_project = arcpy.mp.ArcGISProject("CURRENT")
+    current_project = tools.get_current_aprx()
     project_folder = os.path.dirname(current_project.filePath)
 
     # Save into the current project's folder by default
@@ -107,4 +393,12 @@ if __name__ == "__main__":
 
     full_output_path = os.path.join(exports_folder, base_file_name)
 
-    export_tables_to_excel(full_output_path)
\ No newline at end of file
+    # Parameter 1 (optional): write one workbook per layer instead of one per map
+    one_file_per_layer_param = arcpy.GetParameter(1) if arcpy.GetArgumentCount() > 1 else False
+
+    # Parameter 2 (optional): stack all layers on a single sheet
+    stack_on_single_sheet_param = arcpy.GetParameter(2) if arcpy.GetArgumentCount() > 2 else False
+
+    export_tables_to_excel(full_output_path,
+                           bool(one_file_per_layer_param),
+                           bool(stack_on_single_sheet_param))
\ No newline at end of file
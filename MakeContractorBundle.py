@@ -18,24 +18,64 @@ Workflow
 2) Create dated project folder and .gdb.
 3) Clone template .aprx → new .aprx; set default GDB and folder connections.
 4) For each feature layer in the first map:
-   - Clip to `search_area` → new feature class in the new .gdb.
-   - If result has features, add to the map; else delete the empty class.
+   - Clip to `search_area` → new feature class in the new .gdb
+     (several layers at once, in worker processes).
+   - If anything intersects, add the result to the map; else skip the layer.
    - Remove the original layer from the map.
 5) Save and optionally launch ArcGIS Pro with the new project.
 
 Notes
 -----
-- Layer names are used as output feature class names (must be valid in a file gdb).
-- If name conflicts are possible, consider sanitizing or uniquifying names.
+- Output feature classes are named after their layers, made valid for a file
+  gdb (arcpy.ValidateTableName) and unique ("Roads", "Roads_2", ...).
+- Layers whose data lives only inside the Pro session (memory\ workspaces)
+  can't be read by worker processes, so they are clipped in this process.
 """
 
 import arcpy
 import os
-import subprocess
+from concurrent.futures import Future
 from datetime import datetime
 import arctools as tools
 
 
+# Clips run in separate processes; a few at a time is plenty for one file gdb
+MAX_CLIP_WORKERS = 4
+
+# Workspaces that exist only inside the Pro process; worker processes can't see them
+SESSION_ONLY_WORKSPACES = ("memory\\", "in_memory\\")
+
+
+def make_output_name(layer_name: str, geodatabase_path: str, used_output_names: set) -> str:
+    """
+    Return a valid, unique feature class name in `geodatabase_path` for `layer_name`.
+
+    Two layers often share a name (the same data in two groups, or with
+    different symbology); their clips run concurrently and would otherwise
+    race on one output. Repeats get a "_2", "_3", ... suffix. Geodatabase
+    names are case-insensitive, so `used_output_names` holds the lower-cased
+    names taken so far and is updated in place.
+    """
+    base_name = arcpy.ValidateTableName(layer_name, geodatabase_path)
+    output_name = base_name
+    copy_number = 1
+    while output_name.lower() in used_output_names:
+        copy_number += 1
+        output_name = f"{base_name}_{copy_number}"
+    used_output_names.add(output_name.lower())
+    return output_name
+
+
+def _clip_in_process(*clip_arguments) -> Future:
+    """Run `tools.clip_to_search_area` here, wrapped in an already-finished Future."""
+    future = Future()
+    try:
+        future.set_result(tools.clip_to_search_area(*clip_arguments))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
 def make_contractor_bundle(project_name: str,
                            search_area,
                            launch_when_done: bool,
@@ -65,14 +105,19 @@ def make_contractor_bundle(project_name: str,
     today_str = datetime.now().strftime("%Y%m%d")
     dated_project_name = f"{today_str}_{project_name.strip()}"
 
-    current_project = arcpy.mp.ArcGISProject("CURRENT")
+    current_project = tools.get_current_aprx()
     gis_root = tools.get_gis_root_from_aprx(current_project.filePath)
     projects_root = os.path.join(gis_root, "Projects")
 
+    # Fail fast on name conflicts / overlong paths, before any other work
+    tools.validate_new_project_path(projects_root, dated_project_name)
+
     # Choose template .aprx path
     template_path = (current_project.filePath
                      if use_current_as_template
-                     else tools.get_template_path("_ContractorTemplate"))
+                     else tools.get_template_path("_ContractorTemplate", gis_root))
+    if not use_current_as_template and not tools.template_exists("_ContractorTemplate", gis_root):
+        raise FileNotFoundError(f"❌ Template not found: {template_path}")
 
     # Create folder structure
     project_folder = tools.create_project_folders(projects_root, dated_project_name)
@@ -87,7 +132,10 @@ def make_contractor_bundle(project_name: str,
         template_path=template_path,
         new_project_path=new_aprx_path,
         geodatabase_path=new_geodatabase_path,
-        additional_folder_connections=[project_folder]
+        additional_folder_connections=[project_folder],
+        save=False,  # saved once below, after the map edits
+        # The CURRENT project's layers may use paths relative to its folder
+        rebase_relative_paths=use_current_as_template
     )
 
     # Use the first map in the project (by convention)
@@ -108,35 +156,73 @@ def make_contractor_bundle(project_name: str,
     output_paths_to_add = []
     original_layers_to_remove = []
 
-    for feature_layer in feature_layers:
-        output_feature_class_path = os.path.join(new_geodatabase_path, feature_layer.name)
-        arcpy.AddMessage(f"  ➤ {feature_layer.name} → {output_feature_class_path}")
-
-        # Perform the clip
-        arcpy.analysis.Clip(
-            in_features=feature_layer.dataSource,
-            clip_features=search_area,
-            out_feature_class=output_feature_class_path
-        )
-
-        # Always mark original for removal; we'll re-add only non-empty outputs
-        original_layers_to_remove.append(feature_layer)
-
-        # Keep only non-empty results
-        feature_count = int(arcpy.management.GetCount(output_feature_class_path)[0])
-        if feature_count > 0:
-            output_paths_to_add.append(output_feature_class_path)
+    # One environment scope for all geoprocessing and map edits: the scratch
+    # copy, clips, and deletes never auto-add to the map, and the map tree is
+    # only touched by the two batched passes at the end.
+    with arcpy.EnvManager(addOutputsToMap=False):
+        if feature_layers:
+            # Workers can't receive a Layer/FeatureSet, so share the search area by path
+            search_area_path = arcpy.CreateUniqueName("TempClipSearchArea", new_geodatabase_path)
+            try:
+                arcpy.management.CopyFeatures(search_area, search_area_path)
+
+                # Clip in parallel; every map object stays on this process. Each
+                # PairwiseClip is multi-threaded too, so split the cores between the
+                # workers rather than letting every worker claim all of them.
+                clip_worker_count = max(1, min(MAX_CLIP_WORKERS, len(feature_layers)))
+                parallel_processing_factor = f"{100 // clip_worker_count}%"
+
+                # Names are settled here, before any worker starts writing
+                used_output_names = {os.path.basename(search_area_path).lower()}
+
+                clip_jobs = []
+                with tools.make_process_pool(clip_worker_count) as executor:
+                    for feature_layer in feature_layers:
+                        try:
+                            input_path = feature_layer.dataSource
+                        except (AttributeError, NameError, RuntimeError):
+                            arcpy.AddWarning(f"  ⚠️ {feature_layer.name} has no readable data source; left as-is.")
+                            continue
+
+                        output_name = make_output_name(feature_layer.name,
+                                                       new_geodatabase_path,
+                                                       used_output_names)
+                        output_feature_class_path = os.path.join(new_geodatabase_path, output_name)
+                        arcpy.AddMessage(f"  ➤ {feature_layer.name} → {output_feature_class_path}")
+
+                        clip_arguments = (input_path,
+                                          search_area_path,
+                                          output_feature_class_path,
+                                          parallel_processing_factor)
+                        if input_path.lower().startswith(SESSION_ONLY_WORKSPACES):
+                            future = _clip_in_process(*clip_arguments)
+                        else:
+                            future = executor.submit(tools.clip_to_search_area, *clip_arguments)
+                        clip_jobs.append((feature_layer, output_feature_class_path, future))
+
+                    for feature_layer, output_feature_class_path, future in clip_jobs:
+                        # Always mark original for removal; we'll re-add only non-empty outputs
+                        original_layers_to_remove.append(feature_layer)
+
+                        # Keep only non-empty results (empty ones are never written)
+                        if future.result():
+                            output_paths_to_add.append(output_feature_class_path)
+                        else:
+                            arcpy.AddMessage(f"  ⚠️ {feature_layer.name} has no features in search area; skipped.")
+            finally:
+                # Never leave the scratch copy in the contractor's gdb, even on failure
+                if arcpy.Exists(search_area_path):
+                    arcpy.management.Delete(search_area_path)
         else:
-            arcpy.AddMessage(f"  ⚠️ {feature_layer.name} has no features in search area; deleting.")
-            arcpy.management.Delete(output_feature_class_path)
+            arcpy.AddMessage("  ⚠️ No feature layers to clip.")
 
-    # Add successful outputs to the map
-    for dataset_path in output_paths_to_add:
-        project_map.addDataFromPath(dataset_path)
+        # Add successful outputs to the map
+        for dataset_path in output_paths_to_add:
+            project_map.addDataFromPath(dataset_path)
 
-    # Remove the originals from the map
-    for feature_layer in original_layers_to_remove:
-        project_map.removeLayer(feature_layer)
+        # Remove the originals from the map
+        for feature_layer in original_layers_to_remove:
+            project_map.removeLayer(feature_layer)
 
     # Persist changes
     new_project.save()
@@ -144,10 +230,12 @@ def make_contractor_bundle(project_name: str,
 
     # Optionally launch the new project in ArcGIS Pro
     if launch_when_done:
-        subprocess.Popen([r"C:\Program Files\ArcGIS\Pro\bin\ArcGISPro.exe", new_aprx_path])
+        tools.launch_project(new_aprx_path)
 
 
 if __name__ == "__main__":
+    tools.reset_project_cache()
+
     # Script tool parameter bindings
     project_name_param = arcpy.GetParameterAsText(0)
     search_area_param = arcpy.GetParameter(1)
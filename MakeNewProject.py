@@ -20,8 +20,6 @@ Behavior
 
 import arcpy
 import os
-import subprocess
-import re
 from datetime import datetime
 import arctools as tools
 
@@ -48,12 +46,9 @@ def make_new_project(project_name: str,
     -------
     None
     """
-    # Sanitizers
-    invalid_filename_chars = r'[\\/:*?"<>|]'
-
     # Determine prefix
     if custom_prefix and custom_prefix.strip():
-        raw_prefix = re.sub(invalid_filename_chars, "", custom_prefix.strip())
+        raw_prefix = custom_prefix.strip().translate(tools.INVALID_FILENAME_CHARS)
     else:
         raw_prefix = datetime.now().strftime("%Y%m%d")  # e.g., "20250827"
 
@@ -61,20 +56,25 @@ def make_new_project(project_name: str,
     safe_prefix = raw_prefix.rstrip("_")
 
     # Sanitize the base name
-    sanitized_base_name = re.sub(invalid_filename_chars, "", project_name.strip())
+    sanitized_base_name = project_name.strip().translate(tools.INVALID_FILENAME_CHARS)
 
     # Compose final name
     full_project_name = f"{safe_prefix}_{sanitized_base_name}"
 
     # Derive project roots based on the CURRENT .aprx location
-    current_project = arcpy.mp.ArcGISProject("CURRENT")
+    current_project = tools.get_current_aprx()
     gis_root = tools.get_gis_root_from_aprx(current_project.filePath)
     projects_root = os.path.join(gis_root, "Projects")
 
+    # Fail fast on name conflicts / overlong paths, before any other work
+    tools.validate_new_project_path(projects_root, full_project_name)
+
     # Choose template path
     template_path = (current_project.filePath
                      if use_current_as_template
-                     else tools.get_template_path("_BaseTemplate"))
+                     else tools.get_template_path("_BaseTemplate", gis_root))
+    if not use_current_as_template and not tools.template_exists("_BaseTemplate", gis_root):
+        raise FileNotFoundError(f"❌ Template not found: {template_path}")
 
     # Create folder structure and paths
     project_folder = tools.create_project_folders(projects_root, full_project_name)
@@ -89,17 +89,21 @@ def make_new_project(project_name: str,
         template_path=template_path,
         new_project_path=new_aprx_path,
         geodatabase_path=new_geodatabase_path,
-        additional_folder_connections=[exports_folder, gis_root]
+        additional_folder_connections=[exports_folder, gis_root],
+        # The CURRENT project's layers may use paths relative to its folder
+        rebase_relative_paths=use_current_as_template
     )
 
     arcpy.AddMessage("✅ Project created successfully.")
 
     # Optional launch
     if launch_when_done:
-        subprocess.Popen([r"C:\Program Files\ArcGIS\Pro\bin\ArcGISPro.exe", new_aprx_path])
+        tools.launch_project(new_aprx_path)
 
 
 if __name__ == "__main__":
+    tools.reset_project_cache()
+
     # Script tool parameter bindings
     project_name_param = arcpy.GetParameterAsText(0)         # Required
     launch_when_done_param = arcpy.GetParameter(1)            # Boolean
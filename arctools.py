@@ -11,9 +11,19 @@ Design goals:
 INDEX:
 get_current_aprx
     - Input: N/A
-    - Returns: arcpy.mp.ArcGISProject (CURRENT project object)
+    - Returns: arcpy.mp.ArcGISProject (CURRENT project object, cached)
     - Side effects: None
 
+get_active_map
+    - Input: N/A
+    - Returns: arcpy.mp.Map (active map of the CURRENT project, read fresh each call)
+    - Side effects: None
+
+reset_project_cache
+    - Input: N/A
+    - Returns: None
+    - Side effects: Drops the cached CURRENT project, its settings and template lookups (call at the start of each tool run)
+
 get_gis_root_from_aprx
     - Input: aprx_path (str: path to a .aprx file)
     - Returns: str (GIS root folder, two levels up from aprx_path)
@@ -25,32 +35,76 @@ get_project_folder
     - Side effects: None
 
 get_template_path
-    - Input: base_name (str: template name like "_BaseTemplate")
+    - Input: base_name (str: template name like "_BaseTemplate"),
+             gis_root (str | None: pass it if already known)
     - Returns: str (full path to template .aprx under Projects folder)
     - Side effects: None
 
+template_exists
+    - Input: base_name (str: template name like "_BaseTemplate"),
+             gis_root (str | None: pass it if already known)
+    - Returns: bool (True if the template .aprx from get_template_path is on disk)
+    - Side effects: Remembers the result per template path until reset_project_cache
+
+validate_new_project_path
+    - Input: projects_root (str), project_name (str)
+    - Returns: str (path the new project folder will have)
+    - Side effects: None (raises early if the project can't be created there)
+
 create_project_folders
     - Input: projects_root (str), project_name (str)
     - Returns: str (path to newly created project folder)
     - Side effects: Creates directories for project, "_Exports" (always), ".backups" (commented out)
 
-get_all_feature_layers
+iter_all_feature_layers
     - Input: layers (list of layers), parent_visible (bool, default=True),
              visible_only (bool, default=False), include_groups (bool, default=False)
-    - Returns: list of arcpy layer objects (flattened list of feature layers)
+    - Returns: iterator of arcpy layer objects (flattened, lazily yielded)
     - Side effects: None (pure traversal/filtering)
 
+get_all_feature_layers
+    - Input: same as iter_all_feature_layers
+    - Returns: list of arcpy layer objects (flattened)
+    - Side effects: Same as iter_all_feature_layers
+
+get_all_feature_layers_with_paths
+    - Input: layers (list of layers), visible_only (bool, default=False)
+    - Returns: list of (arcpy layer, str dataSource) tuples
+    - Side effects: None (reads each layer's dataSource exactly once)
+
 clone_project
     - Input: template_path (str), new_project_path (str),
-             geodatabase_path (str | None), additional_folder_connections (list[str] | None)
+             geodatabase_path (str | None), additional_folder_connections (list[str] | None),
+             save (bool, default=True), rebase_relative_paths (bool, default=False)
     - Returns: arcpy.mp.ArcGISProject (newly cloned project object)
     - Side effects:
-        • Saves a copy of template to new_project_path
+        • Copies the template file to new_project_path (saveACopy when rebasing paths)
         • Creates geodatabase (if requested) and sets as default
         • Sets project home folder
         • Updates folder connections
         • Renames "_BaseTemplateMap" to base project name
-        • Saves new project
+        • Saves new project (unless save=False)
+
+has_rows
+    - Input: dataset_path (str: feature class or table)
+    - Returns: bool (True if the dataset has at least one row)
+    - Side effects: None
+
+clip_to_search_area
+    - Input: input_path (str), clip_features_path (str), output_path (str),
+             parallel_processing_factor (str, default="100%")
+    - Returns: bool (True if the clipped output has features)
+    - Side effects: Creates `output_path` only if something intersects the clip area
+
+make_process_pool
+    - Input: max_workers (int)
+    - Returns: concurrent.futures.ProcessPoolExecutor (spawned Python workers)
+    - Side effects: Points multiprocessing at pythonw.exe when running inside ArcGIS Pro
+
+launch_project
+    - Input: aprx_path (str: path to a .aprx file)
+    - Returns: None
+    - Side effects: Opens the project in ArcGIS Pro (via the .aprx file association)
 
 describe_current_project_environment
     - Input: N/A
@@ -65,7 +119,25 @@ print_current_project_environment
 
 import arcpy
 import os
-from typing import Dict, Any
+import sys
+import shutil
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Any, Iterator, Tuple
+
+# Classic Windows MAX_PATH; file gdbs and many arcpy tools still don't accept longer paths
+MAX_WINDOWS_PATH_LENGTH = 260
+
+# Only used when the shell can't open .aprx files itself (no file association)
+ARCGIS_PRO_EXECUTABLE = r"C:\Program Files\ArcGIS\Pro\bin\ArcGISPro.exe"
+
+# Deletes the characters Windows rejects in file/folder names (C-level str.translate)
+INVALID_FILENAME_CHARS = str.maketrans("", "", '\\/:*?"<>|')
 
 # ───────────────────────────────────────────────────────────────────────────────
 # PATH HELPERS
@@ -90,6 +162,37 @@ TODO: Find a way to generalize further, away from my folder layout
 
 
 
+# Snapshot of the CURRENT project's path-like settings (see _current_project_env)
+_ProjectEnv = namedtuple("_ProjectEnv", [
+    "file_path",
+    "file_name",
+    "home_folder",
+    "default_geodatabase",
+    "default_toolbox",
+    "folder_connections",
+])
+
+
+@lru_cache(maxsize=1)
+def _current_aprx_cached():
+    """Open "CURRENT" once; cleared by `reset_project_cache()`."""
+    return arcpy.mp.ArcGISProject("CURRENT")
+
+
+@lru_cache(maxsize=1)
+def _current_project_env() -> _ProjectEnv:
+    """Read the CURRENT project's settings once; cleared by `reset_project_cache()`."""
+    current_project = _current_aprx_cached()
+    return _ProjectEnv(
+        file_path=current_project.filePath,
+        file_name=current_project.fileName,
+        home_folder=current_project.homeFolder,
+        default_geodatabase=current_project.defaultGeodatabase,
+        default_toolbox=current_project.defaultToolbox,
+        folder_connections=current_project.folderConnections,
+    )
+
+
 def get_current_aprx():
     """
     Return
@@ -102,10 +205,44 @@ def get_current_aprx():
     - This returns an object, not a string path.
     - Use `.filePath` to get the full path to the .aprx file, and `.homeFolder`
       to get the designated home folder.
+    - Cached: opening "CURRENT" walks the whole Pro project state, so every
+      caller in a run shares one handle. ArcGIS Pro keeps imported modules
+      alive between tool runs, so scripts call `reset_project_cache()` first.
+    - The handle is live: don't save the project and then expect a fresh
+      reopen from a later call; reset the cache if the project itself changes.
     """
-    return arcpy.mp.ArcGISProject("CURRENT")
+    return _current_aprx_cached()
+
+
+def get_active_map():
+    """
+    Return the active map of the CURRENT project.
+
+    Notes
+    -----
+    - Not cached: the user can switch maps at any time, so `activeMap` is read
+      from the (cached) project handle on every call.
+    """
+    return get_current_aprx().activeMap
+
+
+def reset_project_cache() -> None:
+    """
+    Forget the cached CURRENT project (handle, settings and template lookups)
+    so the next lookup reopens it.
+
+    Call at the top of each script tool run; the user may have opened a
+    different project since this module was first imported. `clone_project`
+    also calls it after saving a new project.
+    """
+    _current_aprx_cached.cache_clear()
+    _current_project_env.cache_clear()
+    get_template_path.cache_clear()
+    _template_found.clear()
+    _template_negative.clear()
 
 
+@lru_cache(maxsize=32)
 def get_gis_root_from_aprx(aprx_path: str) -> str:
     """
     Infer the GIS root folder by walking up two directories from an .aprx path.
@@ -118,7 +255,7 @@ def get_gis_root_from_aprx(aprx_path: str) -> str:
     Returns
     -------
     str
-        Absolute path to the inferred GIS root folder, e.g., r"C:\GIS".
+        Path to the inferred GIS root folder, e.g., r"C:\GIS".
 
     Assumptions
     -----------
@@ -126,8 +263,15 @@ def get_gis_root_from_aprx(aprx_path: str) -> str:
       This climbs up two levels from the .aprx file:
         <aprx>\..  → <ProjectName> folder
         <aprx>\..\.. → "Projects" folder's parent (expected to be "GIS")
+
+    Notes
+    -----
+    - Pure string work (no filesystem access): a symlinked/junctioned project
+      is climbed as given, not resolved to its real location. Pass an absolute
+      path (`ArcGISProject.filePath` always is).
+    - Cached per path; scripts ask for the same CURRENT .aprx repeatedly.
     """
-    return os.path.abspath(os.path.join(os.path.dirname(aprx_path), "..", ".."))
+    return os.path.dirname(os.path.dirname(os.path.dirname(aprx_path)))
 
 
 # Could add this check for aprx/path in others, like get GIS folder
@@ -151,11 +295,12 @@ def get_project_folder(aprx_or_path):
     - If a string path is provided, we take its directory.
     """
     if hasattr(aprx_or_path, "filePath"):   # ArcGISProject instance
-        return os.path.dirname(aprx_or_path.filePath)
-    return os.path.dirname(aprx_or_path)    # Plain string path
+        return str(Path(aprx_or_path.filePath).parent)
+    return str(Path(aprx_or_path).parent)    # Plain string path
 
 
-def get_template_path(base_name: str) -> str:
+@lru_cache(maxsize=64)
+def get_template_path(base_name: str, gis_root: str | None = None) -> str:
     """
     Resolve an .aprx template path under <GIS root>\\Projects\\<base_name>\\<base_name>.aprx.
 
@@ -163,6 +308,9 @@ def get_template_path(base_name: str) -> str:
     ----------
     base_name : str
         The folder and file stem (e.g., "_BaseTemplate", "_ContractorTemplate").
+    gis_root : str | None, optional
+        GIS root folder, if the caller already resolved it. When omitted it is
+        derived from the CURRENT project.
 
     Returns
     -------
@@ -171,11 +319,103 @@ def get_template_path(base_name: str) -> str:
 
     Implementation detail
     ---------------------
-    - Uses the CURRENT project to infer <GIS root>.
+    - Uses the CURRENT project to infer <GIS root> unless `gis_root` is given.
+    - Cached per (base_name, gis_root); `reset_project_cache()` clears it, since
+      gis_root=None means "whatever project is CURRENT".
     """
-    current_project = get_current_aprx()
-    gis_root = get_gis_root_from_aprx(current_project.filePath)
-    return os.path.join(gis_root, "Projects", base_name, f"{base_name}.aprx")
+    if gis_root is None:
+        gis_root = get_gis_root_from_aprx(_current_project_env().file_path)
+    # One f-string instead of os.path.join's per-part separator checks;
+    # base_name is an internal template name, never an absolute path
+    sep = os.sep
+    return f"{gis_root.rstrip(sep)}{sep}Projects{sep}{base_name}{sep}{base_name}.aprx"
+
+
+# Template .aprx paths already checked on disk (see template_exists)
+_template_found = set()
+_template_negative = set()
+
+
+def template_exists(base_name: str, gis_root: str | None = None) -> bool:
+    """
+    Return True if the template .aprx from `get_template_path` exists on disk.
+
+    Notes
+    -----
+    - Both hits and misses are remembered per template path, so scripts that
+      probe several candidate templates only stat each one once per run.
+    - `reset_project_cache()` forgets the results (so does `clone_project`,
+      which may have just written one of those paths).
+    """
+    template_path = get_template_path(base_name, gis_root)
+    if template_path in _template_found:
+        return True
+    if template_path in _template_negative:
+        return False
+    if os.path.isfile(template_path):
+        _template_found.add(template_path)
+        return True
+    _template_negative.add(template_path)
+    return False
+
+@lru_cache(maxsize=256)
+def _normalized(path: str) -> str:
+    """
+    Return a normalized absolute path for equality checks (case-insensitive on Windows).
+
+    Cached: the same few folder connections are compared on every clone. Only
+    relative paths depend on the working directory, and callers pass absolute ones.
+    Absolute paths skip `abspath` (and its `getcwd()` call) and are just normpath'd.
+    """
+    if os.path.isabs(path):
+        return os.path.normcase(os.path.normpath(path))
+    return os.path.normcase(os.path.abspath(path))
+
+
+def validate_new_project_path(projects_root: str, project_name: str) -> str:
+    """
+    Check, before any other work, that a new project can be created.
+
+    Parameters
+    ----------
+    projects_root : str
+        Path to the Projects root (e.g., r"C:\GIS\Projects").
+    project_name : str
+        Name for the new project folder (and its .aprx / .gdb).
+
+    Returns
+    -------
+    str
+        Full path the new project folder will have.
+
+    Raises
+    ------
+    FileExistsError
+        If the project folder already exists.
+    ValueError
+        If the deepest path the project will contain (a table inside its
+        file geodatabase) would exceed the Windows MAX_PATH limit.
+
+    Notes
+    -----
+    - Meant to run right after the project name is composed, so a doomed run
+      fails before templates are resolved, folders are made, or GDBs created.
+    - Long paths are rejected rather than prefixed with "\\?\": ArcGIS Pro and
+      file geodatabases don't reliably accept extended-length paths.
+    """
+    project_folder = os.path.join(projects_root, project_name)
+
+    # e.g. <folder>\<name>.gdb\a00000001.gdbtable
+    deepest_path = os.path.join(project_folder, f"{project_name}.gdb", "a00000001.gdbtable")
+    if len(deepest_path) >= MAX_WINDOWS_PATH_LENGTH:
+        raise ValueError(f"❌ Project path is too long ({len(deepest_path)} characters, "
+                         f"limit {MAX_WINDOWS_PATH_LENGTH - 1}); use a shorter name: {project_folder}")
+
+    if os.path.exists(project_folder):
+        raise FileExistsError(f"❌ Project folder already exists: {project_folder}")
+
+    return project_folder
+
 
 # Taking out optional folders for now. Everyone gets Export.
 # Taking out backup folder, but I'll leave the lines. Look into what it does more.
@@ -190,8 +430,6 @@ def create_project_folders(projects_root: str,
         Path to the Projects root (e.g., r"C:\GIS\Projects").
     project_name : str
         Name for the new project folder (e.g., "20250826_FortHuachuca").
-    include_exports : bool, optional
-        If True, create an "_Exports" subfolder, by default True.
 
     Returns
     -------
@@ -207,16 +445,21 @@ def create_project_folders(projects_root: str,
     ------------
     - Creates:
         <projects_root>\<project_name>\
-        <projects_root>\<project_name>\_Exports   (optional)
+        <projects_root>\<project_name>\_Exports   (always)
         <projects_root>\<project_name>\.backups   (Commented out)
     """
     project_folder = os.path.join(projects_root, project_name)
+    exports_folder = os.path.join(project_folder, "_Exports")
 
-    if os.path.exists(project_folder):
+    # One makedirs creates the project folder and _Exports together; the
+    # isdir check is what catches an existing project folder
+    if os.path.isdir(project_folder):
         raise FileExistsError(f"❌ Project folder already exists: {project_folder}")
-
-    os.makedirs(project_folder)
-    os.makedirs(os.path.join(project_folder, "_Exports"), exist_ok=True)
+    try:
+        os.makedirs(exports_folder)
+    except FileExistsError:
+        # Created by someone else between the check and makedirs
+        raise FileExistsError(f"❌ Project folder already exists: {project_folder}") from None
     # os.makedirs(os.path.join(project_folder, ".backups"), exist_ok=True)
 
     return project_folder
@@ -226,12 +469,12 @@ def create_project_folders(projects_root: str,
 # LAYER FILTERING
 # ───────────────────────────────────────────────────────────────────────────────
 
-def get_all_feature_layers(layers,
-                           parent_visible: bool = True,
-                           visible_only: bool = False,
-                           include_groups: bool = False):
+def iter_all_feature_layers(layers,
+                            parent_visible: bool = True,
+                            visible_only: bool = False,
+                            include_groups: bool = False) -> Iterator[Any]:
     """
-    Recursively collect feature layers from a list of layers (including groups).
+    Yield feature layers from a list of layers, walking into group layers.
 
     Parameters
     ----------
@@ -247,40 +490,100 @@ def get_all_feature_layers(layers,
 
     Returns
     -------
-    list
-        Flattened list of layers that pass the filters.
+    Iterator
+        Lazily yields the layers that pass the filters, in table-of-contents
+        order, so callers can stop early (e.g. `next(...)` for the first match).
+        Use `get_all_feature_layers` for a list.
 
     Behavior
     --------
-    - Traverses group layers recursively.
+    - Traverses nested group layers depth-first with an explicit stack (no
+      recursion, so no per-group generator frames).
     - Skips basemap layers.
-    - For feature layers, checks for "dataSource" support before collecting.
+    - Does not probe `layer.supports("dataSource")` (an extra round-trip per
+      layer); callers that read `dataSource` should catch NameError (arcpy's
+      "attribute not supported" error), AttributeError and RuntimeError for
+      the rare feature layer without one.
+    - Each layer property is a round-trip into ArcGIS Pro, so each one is read
+      at most once per layer; `visible` is only read when `visible_only` is set.
+    - With `visible_only`, a hidden group's children are never listed or read.
     """
-    collected_layers = []
-
-    for layer in layers:
-        effective_visibility = layer.visible and parent_visible
+    if visible_only and not parent_visible:
+        return  # everything under a hidden parent is hidden
+
+    # Explicit stack instead of recursion: no generator frame per group layer.
+    # Children are pushed in reverse so they pop in table-of-contents order.
+    # With visible_only, anything still on the stack has only visible parents.
+    pending = list(reversed(list(layers)))
+    pop = pending.pop
+    push = pending.extend
+    while pending:
+        layer = pop()
+        if visible_only and not layer.visible:
+            continue  # hidden: skip the layer and its whole subtree unread
 
         if layer.isGroupLayer:
             # Optionally include the group layer itself
-            if include_groups and (not visible_only or effective_visibility):
-                collected_layers.append(layer)
-
-            # Recurse into the group's children
-            child_layers = layer.listLayers()
-            collected_layers.extend(
-                get_all_feature_layers(
-                    child_layers,
-                    parent_visible=effective_visibility,
-                    visible_only=visible_only,
-                    include_groups=include_groups
-                )
-            )
-        elif layer.isFeatureLayer and layer.supports("dataSource") and not layer.isBasemapLayer:
-            if not visible_only or effective_visibility:
-                collected_layers.append(layer)
-
-    return collected_layers
+            if include_groups:
+                yield layer
+
+            # Walk the group's children next
+            push(reversed(layer.listLayers()))
+        elif layer.isFeatureLayer and not layer.isBasemapLayer:
+            yield layer
+
+
+def get_all_feature_layers(layers,
+                           parent_visible: bool = True,
+                           visible_only: bool = False,
+                           include_groups: bool = False) -> list:
+    """
+    List version of `iter_all_feature_layers` (same parameters and filters).
+
+    Returns
+    -------
+    list
+        The matching layers, in table-of-contents order.
+    """
+    return list(iter_all_feature_layers(layers,
+                                        parent_visible=parent_visible,
+                                        visible_only=visible_only,
+                                        include_groups=include_groups))
+
+
+def get_all_feature_layers_with_paths(layers, visible_only: bool = False):
+    """
+    Like `get_all_feature_layers`, but pair each layer with its data source path.
+
+    Parameters
+    ----------
+    layers : list[arcpy.mapping.Layer | arcpy._mp.LayerFile]
+        A list from Map.listLayers() or GroupLayer.listLayers().
+    visible_only : bool, optional
+        If True, only return layers that are *effectively visible*.
+
+    Returns
+    -------
+    list[tuple]
+        (layer, data_source_path) for every feature layer that passes the filter.
+
+    Notes
+    -----
+    - `Layer.dataSource` resolves the layer's workspace on every access, which
+      is noticeable on network-hosted geodatabases. Reading it once here lets
+      callers use the plain string for ListFields, cursors, basenames, etc.
+    - Group layers are never included (they have no data source), and neither
+      are feature layers whose data source can't be read (e.g. broken links).
+    """
+    layers_with_paths = []
+    for layer in iter_all_feature_layers(layers,
+                                         visible_only=visible_only,
+                                         include_groups=False):
+        try:
+            layers_with_paths.append((layer, layer.dataSource))
+        except (AttributeError, NameError, RuntimeError):
+            continue
+    return layers_with_paths
 
 
 # ───────────────────────────────────────────────────────────────────────────────
@@ -290,7 +593,9 @@ def get_all_feature_layers(layers,
 def clone_project(template_path: str,
                   new_project_path: str,
                   geodatabase_path: str | None = None,
-                  additional_folder_connections: list[str] | None = None):
+                  additional_folder_connections: list[str] | None = None,
+                  save: bool = True,
+                  rebase_relative_paths: bool = False):
     """
     Create a new .aprx from a template and configure its environment.
 
@@ -304,6 +609,15 @@ def clone_project(template_path: str,
         If provided, create (if missing) and set as the default file geodatabase.
     additional_folder_connections : list[str] | None, optional
         Extra folder connections to add (besides the home folder).
+    save : bool, optional
+        If True (default), save the configured project before returning. Pass
+        False when the caller keeps editing and saves once at the end.
+    rebase_relative_paths : bool, optional
+        If True, write the copy with arcpy's `saveACopy`, which re-bases
+        relative data-source paths to the new location. Pass True when the
+        template is a working project whose layers point at its own folder
+        (e.g. the CURRENT project used as a template); the byte copy would
+        leave those layers pointing at <new folder>\<old name>.gdb.
 
     Returns
     -------
@@ -312,7 +626,10 @@ def clone_project(template_path: str,
 
     Side Effects
     ------------
-    - Saves a copy of the template .aprx to `new_project_path`.
+    - Copies the template .aprx file's contents to `new_project_path` (a plain
+      file copy; the template's read-only bit and timestamps are not carried
+      over; falls back to arcpy's saveACopy if the file can't be copied, and
+      uses saveACopy outright with `rebase_relative_paths`).
     - Sets the project's home folder to the folder containing `new_project_path`.
     - Optionally creates and assigns a default file geodatabase.
     - Replaces folder connections with:
@@ -322,19 +639,33 @@ def clone_project(template_path: str,
     -----
     - This function opens the newly created project and returns it; callers can
       then list maps, add layers, etc., and finally call `aprx.save()`.
+    - With save=False nothing is written back until the caller saves, so the
+      project XML is serialized once instead of twice.
     """
     if additional_folder_connections is None:
         additional_folder_connections = []
 
-    # 1) Copy template → new .aprx, then open it
-    arcpy.mp.ArcGISProject(template_path).saveACopy(new_project_path)
+    # 1) Copy template → new .aprx, then open it (only the copy is ever parsed)
+    if rebase_relative_paths:
+        # A byte copy keeps relative paths pointing at the old location
+        arcpy.mp.ArcGISProject(template_path).saveACopy(new_project_path)
+    else:
+        try:
+            # Contents only: copy2/copymode would carry a read-only template's
+            # permission bits onto the new project and make save() fail
+            shutil.copyfile(template_path, new_project_path)
+        except OSError:
+            # e.g. the template is locked; let arcpy read it and write the copy
+            arcpy.mp.ArcGISProject(template_path).saveACopy(new_project_path)
     new_project = arcpy.mp.ArcGISProject(new_project_path)
 
     # 2) Create/set default GDB (if requested)
     if geodatabase_path:
         geodatabase_directory = os.path.dirname(geodatabase_path)
         geodatabase_name = os.path.basename(geodatabase_path)
-        if not os.path.exists(geodatabase_path):
+        # arcpy.Exists answers from the workspace catalog; CreateFileGDB would
+        # otherwise fail outright on an existing gdb
+        if not arcpy.Exists(geodatabase_path):
             arcpy.management.CreateFileGDB(geodatabase_directory, geodatabase_name)
         new_project.defaultGeodatabase = geodatabase_path
 
@@ -345,28 +676,17 @@ def clone_project(template_path: str,
     new_project.homeFolder = project_folder
 
     # 5) Build folder connections from scratch
-    def _normalized(path: str) -> str:
-        """Return a normalized absolute path for equality checks (case-insensitive on Windows)."""
-        return os.path.normcase(os.path.abspath(path))
-
     normalized_home = _normalized(project_folder)
-    folder_connections = [{
-        "connectionString": project_folder,
-        "alias": "",
-        "isHomeFolder": True
-    }]
-
-    for candidate_path in additional_folder_connections:
-        if not candidate_path:
-            continue
-        if _normalized(candidate_path) == normalized_home:
-            # Skip adding a duplicate of the home folder as a separate connection
-            continue
-        folder_connections.append({
-            "connectionString": candidate_path,
-            "alias": "",
-            "isHomeFolder": False
-        })
+    normalized_additions = [(candidate_path, _normalized(candidate_path))
+                            for candidate_path in additional_folder_connections
+                            if candidate_path]
+    folder_connections = [
+        {"connectionString": project_folder, "alias": "", "isHomeFolder": True},
+        # Skip duplicates of the home folder as separate connections
+        *({"connectionString": candidate_path, "alias": "", "isHomeFolder": False}
+          for candidate_path, normalized_candidate in normalized_additions
+          if normalized_candidate != normalized_home),
+    ]
 
     # 6) Rename default _BaseTemplateMap to whatever the project name is without a date
     base_name = os.path.splitext(os.path.basename(new_project_path))[0]
@@ -377,14 +697,219 @@ def clone_project(template_path: str,
             m.name = base_name
 
     new_project.updateFolderConnections(folder_connections)  # validate=True by default
-    new_project.save()
+    if save:
+        new_project.save()
+
+    # Anything cached about "the current project" may be stale after this
+    reset_project_cache()
     return new_project
 
 
+# ───────────────────────────────────────────────────────────────────────────────
+# GEOPROCESSING
+# ───────────────────────────────────────────────────────────────────────────────
+
+def has_rows(dataset_path) -> bool:
+    """
+    Return True if `dataset_path` contains at least one row.
+
+    Also accepts a feature layer; a cursor on a layer only sees its selection.
+
+    Notes
+    -----
+    - Cheaper than arcpy.management.GetCount: no geoprocessing tool dispatch,
+      and the cursor stops at the first row instead of counting the table.
+    """
+    with arcpy.da.SearchCursor(dataset_path, ["OID@"]) as cursor:
+        for _ in cursor:
+            return True
+    return False
+
+
+def clip_to_search_area(input_path: str,
+                        clip_features_path: str,
+                        output_path: str,
+                        parallel_processing_factor: str = "100%") -> bool:
+    """
+    Clip one dataset to a search area, keeping the output only if it has features.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the feature class to clip (e.g., a layer's `dataSource`).
+    clip_features_path : str
+        Path to a polygon feature class to clip to. Must be a path, not a Layer
+        or FeatureSet, so it can be handed to a worker process.
+    output_path : str
+        Path of the feature class to create.
+    parallel_processing_factor : str, optional
+        `arcpy.env.parallelProcessingFactor` for the PairwiseClip call, by
+        default "100%" (one thread per core).
+
+    Returns
+    -------
+    bool
+        True if `output_path` exists and has features; False if nothing fell
+        inside the clip area (no output is left behind).
+
+    Notes
+    -----
+    - Takes and returns only plain values so it can run in a process pool
+      (see `make_process_pool`).
+    - Inputs with nothing intersecting the search area are detected with a
+      selection first (checked with `has_rows`, not GetCount), so they never
+      create (and then delete) an empty output.
+    - Uses PairwiseClip, which is multi-threaded internally. The environment
+      is set here rather than by the caller because arcpy.env does not carry
+      over into worker processes.
+    """
+    check_layer = arcpy.management.MakeFeatureLayer(input_path, "clip_intersect_check")[0]
+    try:
+        arcpy.management.SelectLayerByLocation(check_layer, "INTERSECT", clip_features_path)
+        # A cursor on the layer honors its selection and stops at the first row
+        any_intersecting = has_rows(check_layer)
+    finally:
+        arcpy.management.Delete(check_layer)
+
+    if not any_intersecting:
+        return False
+
+    with arcpy.EnvManager(parallelProcessingFactor=parallel_processing_factor):
+        arcpy.analysis.PairwiseClip(
+            in_features=input_path,
+            clip_features=clip_features_path,
+            out_feature_class=output_path
+        )
+
+    # Features that only touch the boundary can still clip to nothing
+    if has_rows(output_path):
+        return True
+
+    arcpy.management.Delete(output_path)
+    return False
+
+
+def make_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return a ProcessPoolExecutor whose workers are plain Python interpreters.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker processes.
+
+    Notes
+    -----
+    - Inside ArcGIS Pro, `sys.executable` is ArcGISPro.exe, so spawned workers
+      would launch Pro itself. Point multiprocessing at the environment's
+      pythonw.exe instead.
+    - Worker functions must live in an importable module (like this one), not
+      in a script tool's __main__.
+    """
+    spawn_context = multiprocessing.get_context("spawn")
+    if not os.path.basename(sys.executable).lower().startswith("python"):
+        spawn_context.set_executable(os.path.join(sys.exec_prefix, "pythonw.exe"))
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn_context)
+
+
+# ───────────────────────────────────────────────────────────────────────────────
+# PROJECT LAUNCH
+# ───────────────────────────────────────────────────────────────────────────────
+
+def launch_project(aprx_path: str) -> None:
+    """
+    Open an .aprx in ArcGIS Pro without waiting for it.
+
+    Parameters
+    ----------
+    aprx_path : str
+        Full path to the project to open.
+
+    Notes
+    -----
+    - Uses `os.startfile`, which hands the file straight to the Windows shell
+      (ShellExecute) and lets the .aprx association pick the Pro install.
+    - Falls back to launching ARCGIS_PRO_EXECUTABLE directly if `os.startfile`
+      is unavailable (non-Windows) or the association is missing.
+    """
+    try:
+        os.startfile(aprx_path, "open")
+    except (AttributeError, OSError):
+        subprocess.Popen([ARCGIS_PRO_EXECUTABLE, aprx_path])
+
+
 # ───────────────────────────────────────────────────────────────────────────────
 # PROJECT ENVIRONMENT INFO
 # ───────────────────────────────────────────────────────────────────────────────
 
+def _stat_many(paths) -> Dict[str, Tuple[bool, bool]]:
+    """
+    Answer isdir/isfile for several paths, listing a folder only when that
+    saves stat() calls.
+
+    Returns
+    -------
+    Dict[str, Tuple[bool, bool]]
+        ``{path: (is_dir, is_file)}`` for every non-empty path given.
+
+    Notes
+    -----
+    - The .aprx, default gdb and toolbox usually share the project folder, and
+      on network shares each separate stat() is a round trip; one `os.scandir`
+      of that folder answers all of them from the DirEntry type bits.
+    - A folder is only listed when two or more distinct requested paths sit
+      directly in it. Listing `...\Projects` to check one project folder would
+      read every project on the share, so a lone path gets a plain stat.
+    - A folder that was listed successfully is known to exist, so a requested
+      path that *is* such a folder (the project folder, typically) needs no
+      stat and doesn't count towards listing its own parent.
+    - Names are matched with `os.path.normcase` (case-insensitive on Windows).
+    """
+    # folder -> {normcased name: [requested paths]}
+    members_by_folder = {}
+    for path in paths:
+        if not path:
+            continue
+        folder, name = os.path.split(os.path.abspath(path))
+        if not name:
+            continue                                                     # drive root: stat below
+        members_by_folder.setdefault(os.path.normcase(folder), {}) \
+                         .setdefault(os.path.normcase(name), []).append(path)
+
+    # Worth listing: two or more distinct names; folders that will be listed
+    # themselves are settled by their own listing, so don't count them
+    candidate_folders = {folder for folder, members in members_by_folder.items() if len(members) >= 2}
+    folders_to_list = {
+        folder for folder in candidate_folders
+        if sum(os.path.join(folder, name) not in candidate_folders
+               for name in members_by_folder[folder]) >= 2
+    }
+
+    path_kinds = {}
+    listed_folders = set()
+    for folder in folders_to_list:
+        try:
+            with os.scandir(folder) as folder_entries:
+                entries_by_name = {os.path.normcase(entry.name): entry for entry in folder_entries}
+        except OSError:
+            continue                                                     # stat its members below
+        listed_folders.add(folder)
+        for name, member_paths in members_by_folder[folder].items():
+            entry = entries_by_name.get(name)
+            kind = (entry.is_dir(), entry.is_file()) if entry is not None else (False, False)
+            for path in member_paths:
+                path_kinds[path] = kind
+
+    for path in paths:
+        if not path or path in path_kinds:
+            continue
+        if os.path.normcase(os.path.abspath(path)) in listed_folders:
+            path_kinds[path] = (True, False)                             # scandir just read it
+        else:
+            path_kinds[path] = (os.path.isdir(path), os.path.isfile(path))
+    return path_kinds
+
+
 def describe_current_project_environment() -> Dict[str, Any]:
     """
     Return a comprehensive description of the CURRENT ArcGIS Pro project's environment.
@@ -456,32 +981,43 @@ def describe_current_project_environment() -> Dict[str, Any]:
     - The "home folder" is a logical working directory for the project and may be set to
       any accessible path; it is not required to match the physical location of the .aprx.
     """
-    current_project = arcpy.mp.ArcGISProject("CURRENT")
+    current_project = get_current_aprx()
+    project_env = _current_project_env()                                 # cached property reads
 
     # Core identity
-    project_file_path = current_project.filePath                         # full path to .aprx
-    project_file_name = current_project.fileName                         # just the file name
+    project_file_path = project_env.file_path                            # full path to .aprx
+    project_file_name = project_env.file_name                            # just the file name
     project_folder = os.path.dirname(project_file_path)                  # folder containing .aprx
-    project_home_folder = current_project.homeFolder                     # ArcGIS Pro "Home" folder
+    project_home_folder = project_env.home_folder                        # ArcGIS Pro "Home" folder
 
     # Defaults (project-level)
-    project_default_geodatabase = current_project.defaultGeodatabase     # path to .gdb
-    project_default_toolbox = current_project.defaultToolbox             # path to .atbx or .tbx
+    project_default_geodatabase = project_env.default_geodatabase        # path to .gdb
+    project_default_toolbox = project_env.default_toolbox                # path to .atbx or .tbx
 
     # Existence checks (best-effort sanity signals; not authoritative for permissions)
-    exists_project_file_path = os.path.exists(project_file_path)
-    exists_project_folder = os.path.isdir(project_folder)
-    exists_project_home_folder = os.path.isdir(project_home_folder) if project_home_folder else False
-    exists_project_default_geodatabase = os.path.isdir(project_default_geodatabase) if project_default_geodatabase else False
-    exists_project_default_toolbox = os.path.isfile(project_default_toolbox) if project_default_toolbox else False
+    # One directory listing per parent folder instead of a stat() per path
+    path_kinds = _stat_many([
+        project_file_path,
+        project_folder,
+        project_home_folder,
+        project_default_geodatabase,
+        project_default_toolbox,
+    ])
+    no_path = (False, False)
+    exists_project_file_path = any(path_kinds.get(project_file_path, no_path))
+    exists_project_folder = path_kinds.get(project_folder, no_path)[0]
+    exists_project_home_folder = path_kinds.get(project_home_folder, no_path)[0]
+    exists_project_default_geodatabase = path_kinds.get(project_default_geodatabase, no_path)[0]
+    exists_project_default_toolbox = path_kinds.get(project_default_toolbox, no_path)[1]
 
     # Additional context
-    map_names = [map_object.name for map_object in current_project.listMaps()]
-    layout_names = [layout_object.name for layout_object in current_project.listLayouts()]
+    get_name = attrgetter("name")
+    map_names = list(map(get_name, current_project.listMaps()))
+    layout_names = list(map(get_name, current_project.listLayouts()))
 
     # Folder connections as stored in the project (home should appear here with isHomeFolder=True)
     # Example entry: {"connectionString": r"C:\GIS\Projects\MyProj", "alias": "", "isHomeFolder": True}
-    folder_connections = current_project.folderConnections
+    folder_connections = project_env.folder_connections
 
     return {
         # Core project identity
@@ -509,5 +1045,5 @@ def describe_current_project_environment() -> Dict[str, Any]:
 
 def print_current_project_environment() -> None:
     project_info = describe_current_project_environment()
-    for key_name, value in project_info.items():
-        arcpy.AddMessage(f"{key_name}: {value}")
+    # One message instead of one per key: each AddMessage is a round-trip to Pro
+    arcpy.AddMessage("\n".join(f"{key_name}: {value}" for key_name, value in project_info.items()))